@@ -1,61 +1,54 @@
 #!/usr/bin/env python3
-import json
-from statistics import mean, median
+import numpy as np
+
+try:
+    # orjson parses large result dumps several times faster than stdlib json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Load results
-with open('python_test_results_final.json', 'r') as f:
-    python_results = json.load(f)
+with open('python_test_results_final.json', 'rb') as f:
+    python_results = json_loads(f.read())
 
-with open('swift_test_results_final.json', 'r') as f:
-    swift_results = json.load(f)
+with open('swift_test_results_final.json', 'rb') as f:
+    swift_results = json_loads(f.read())
 
-# Analyze results
+# Convert the Array-of-Structs result lists to Structure-of-Arrays once,
+# so every count and ratio below is a vectorized C-level pass
 total_tests = len(swift_results)
-swift_passed = 0
-python_passed = 0
-both_passed = 0
-swift_only = 0
-python_only = 0
-performance_ratios = []
+n = total_tests
+
+sw_ok = np.fromiter((t['default']['success'] for t in swift_results), dtype=bool, count=n)
+py_ok = np.fromiter((t['default']['success'] for t in python_results), dtype=bool, count=n)
+sw_ms = np.fromiter((t['default'].get('timeMs', 0.0) for t in swift_results), dtype=np.float64, count=n)
+py_ms = np.fromiter((t['default'].get('timeMs', 0.0) for t in python_results), dtype=np.float64, count=n)
+
+sw_fuzzy_ok = np.fromiter((bool(f := t.get('fuzzy')) and f['success'] for t in swift_results), dtype=bool, count=n)
+py_fuzzy_ok = np.fromiter((bool(f := t.get('fuzzy')) and f['success'] for t in python_results), dtype=bool, count=n)
+
+both = sw_ok & py_ok
+swift_only_mask = sw_ok & ~py_ok
 
-for i, (swift_test, python_test) in enumerate(zip(swift_results, python_results)):
-    # Check default mode success
-    swift_success = swift_test['default']['success']
-    python_success = python_test['default']['success']
-    
-    if swift_success:
-        swift_passed += 1
-    if python_success:
-        python_passed += 1
-    if swift_success and python_success:
-        both_passed += 1
-        # Calculate performance ratio
-        swift_time = swift_test['default']['timeMs']
-        python_time = python_test['default']['timeMs']
-        if python_time > 0 and swift_time > 0:
-            ratio = swift_time / python_time
-            performance_ratios.append(ratio)
-    if swift_success and not python_success:
-        swift_only += 1
-    if python_success and not swift_success:
-        python_only += 1
+swift_passed = int(sw_ok.sum())
+python_passed = int(py_ok.sum())
+both_passed = int(both.sum())
+python_only = int((py_ok & ~sw_ok).sum())
+swift_fuzzy_passed = int(sw_fuzzy_ok.sum())
+python_fuzzy_passed = int(py_fuzzy_ok.sum())
 
-# Check fuzzy mode
-swift_fuzzy_passed = 0
-python_fuzzy_passed = 0
+# Performance ratios where both sides passed with a measurable time
+timed = both & (sw_ms > 0) & (py_ms > 0)
+ratios = sw_ms[timed] / py_ms[timed]
 
-for swift_test, python_test in zip(swift_results, python_results):
-    if 'fuzzy' in swift_test and swift_test['fuzzy']['success']:
-        swift_fuzzy_passed += 1
-    if 'fuzzy' in python_test and python_test['fuzzy']['success']:
-        python_fuzzy_passed += 1
+swift_only_tests = [swift_results[i] for i in np.nonzero(swift_only_mask)[0]]
 
 print(f"Total test cases: {total_tests}")
 print(f"\nDefault mode:")
 print(f"  Swift passed: {swift_passed}/{total_tests} ({swift_passed/total_tests*100:.1f}%)")
 print(f"  Python passed: {python_passed}/{total_tests} ({python_passed/total_tests*100:.1f}%)")
 print(f"  Both passed: {both_passed}/{total_tests} ({both_passed/total_tests*100:.1f}%)")
-print(f"  Swift only: {swift_only}")
+print(f"  Swift only: {len(swift_only_tests)}")
 print(f"  Python only: {python_only}")
 
 print(f"\nWith fuzzy mode:")
@@ -64,15 +57,15 @@ total_python = python_passed + python_fuzzy_passed
 print(f"  Swift total: {total_swift}/{total_tests} ({total_swift/total_tests*100:.1f}%)")
 print(f"  Python total: {total_python}/{total_tests} ({total_python/total_tests*100:.1f}%)")
 
-if performance_ratios:
+if ratios.size:
+    # Vectorized stats: one C-level pass each instead of Python loops
     print(f"\nPerformance (for tests both passed):")
-    print(f"  Average ratio: {mean(performance_ratios):.2f}x")
-    print(f"  Median ratio: {median(performance_ratios):.2f}x")
-    print(f"  Best ratio: {min(performance_ratios):.2f}x (Swift faster)")
-    print(f"  Worst ratio: {max(performance_ratios):.2f}x")
+    print(f"  Average ratio: {ratios.mean():.2f}x")
+    print(f"  Median ratio: {np.median(ratios):.2f}x")
+    print(f"  Best ratio: {ratios.min():.2f}x (Swift faster)")
+    print(f"  Worst ratio: {ratios.max():.2f}x")
 
-# Find Swift-exclusive features
+# Find Swift-exclusive features (collected during the main pass)
 print("\n## Swift-exclusive successes:")
-for i, (swift_test, python_test) in enumerate(zip(swift_results, python_results)):
-    if swift_test['default']['success'] and not python_test['default']['success']:
-        print(f"  - {swift_test['description']}: {swift_test['input']}")
\ No newline at end of file
+for swift_test in swift_only_tests:
+    print(f"  - {swift_test['description']}: {swift_test['input']}")
\ No newline at end of file
@@ -3,65 +3,72 @@
 Compare Python dateutil and Swift DateParser test results
 """
 
-import json
+import heapq
 import sys
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser as dateutil_parser
 
+try:
+    # orjson parses large result dumps several times faster than stdlib json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 def load_results():
     """Load test results from JSON files"""
     try:
-        with open('python_test_results.json', 'r') as f:
-            python_results = json.load(f)
+        with open('python_test_results.json', 'rb') as f:
+            python_results = json_loads(f.read())
     except FileNotFoundError:
         print("Error: python_test_results.json not found. Run test_comparison.py first.")
         sys.exit(1)
-    
+
     try:
-        with open('swift_test_results.json', 'r') as f:
-            swift_results = json.load(f)
+        with open('swift_test_results.json', 'rb') as f:
+            swift_results = json_loads(f.read())
     except FileNotFoundError:
         print("Error: swift_test_results.json not found. Run Swift TestComparison first.")
         sys.exit(1)
     
     return python_results, swift_results
 
-def normalize_dates(date_str):
-    """Normalize date strings for comparison"""
-    if not date_str:
-        return None
-    
+def _fast_isoparse(date_str):
+    """Parse an ISO date string, preferring the C-implemented fromisoformat"""
     try:
-        # Parse and normalize to UTC ISO format
-        dt = dateutil_parser.isoparse(date_str)
-        return dt.strftime('%Y-%m-%d %H:%M:%S')
-    except:
-        return date_str
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return dateutil_parser.isoparse(date_str)
+
+@lru_cache(maxsize=4096)
+def _parse_or_none(date_str):
+    """Parse an ISO date string, memoized; returns None for unparseable input"""
+    try:
+        return _fast_isoparse(date_str)
+    except (ValueError, TypeError, dateutil_parser.ParserError):
+        return None
 
 def compare_dates(python_date, swift_date):
     """Compare two date strings, accounting for timezone differences"""
     if not python_date or not swift_date:
         return python_date == swift_date
-    
+
+    # Parse each side once (cached across the result set) and reuse the
+    # datetime for both checks
+    py_dt = _parse_or_none(python_date)
+    sw_dt = _parse_or_none(swift_date)
+
     # Normalize both dates
-    norm_python = normalize_dates(python_date)
-    norm_swift = normalize_dates(swift_date)
-    
+    norm_python = py_dt.strftime('%Y-%m-%d %H:%M:%S') if py_dt else python_date
+    norm_swift = sw_dt.strftime('%Y-%m-%d %H:%M:%S') if sw_dt else swift_date
+
     if norm_python == norm_swift:
         return True
-    
+
     # Check if they're the same date but different times (common for date-only inputs)
-    try:
-        py_dt = dateutil_parser.isoparse(python_date)
-        sw_dt = dateutil_parser.isoparse(swift_date)
-        
-        # Check if dates match (ignoring time)
-        if py_dt.date() == sw_dt.date():
-            return True
-            
-    except:
-        pass
-    
+    if py_dt and sw_dt and py_dt.date() == sw_dt.date():
+        return True
+
     return False
 
 def analyze_results(python_results, swift_results):
@@ -89,30 +96,36 @@ def analyze_results(python_results, swift_results):
             print(f"ERROR: Test mismatch at index {i}")
             continue
         
-        py_success = py_test['default']['success']
-        sw_success = sw_test['default']['success']
-        
+        # Hoist the per-mode dicts to locals to avoid repeated key lookups
+        pyd = py_test['default']
+        swd = sw_test['default']
+        py_success = pyd['success']
+        sw_success = swd['success']
+
         # Categorize results
         if py_success and sw_success:
             both_success.append((py_test, sw_test))
-            
+
             # Check if results match
-            if not compare_dates(py_test['default']['date'], sw_test['default']['date']):
+            if not compare_dates(pyd['date'], swd['date']):
                 different_results.append((py_test, sw_test))
-                
+
         elif not py_success and not sw_success:
             both_fail.append((py_test, sw_test))
         elif py_success and not sw_success:
             python_only_success.append((py_test, sw_test))
         else:  # Swift success, Python fail
             swift_only_success.append((py_test, sw_test))
-        
+
         # Collect performance data for successful parses
         if py_success and sw_success:
+            py_ms = pyd['time_ms']
+            sw_ms = swd['timeMs']
             performance_comparison.append({
                 'input': py_test['input'],
-                'python_ms': py_test['default']['time_ms'],
-                'swift_ms': sw_test['default']['timeMs']
+                'python_ms': py_ms,
+                'swift_ms': sw_ms,
+                'ratio': sw_ms / py_ms if py_ms > 0 else float('inf')
             })
     
     # Print summary
@@ -143,8 +156,9 @@ def analyze_results(python_results, swift_results):
             print(f"    Python error: {py_test['default']['error']}")
             
             # Check if Python succeeds with fuzzy
-            if py_test['fuzzy'] and py_test['fuzzy']['success']:
-                print(f"    Python fuzzy: {py_test['fuzzy']['date']} ✓")
+            pf = py_test.get('fuzzy')
+            if pf and pf['success']:
+                print(f"    Python fuzzy: {pf['date']} ✓")
         print()
     
     if different_results:
@@ -172,55 +186,55 @@ def analyze_results(python_results, swift_results):
         print(f"  Swift:  {avg_swift_ms:.3f}ms")
         print(f"  Ratio:  {avg_swift_ms/avg_python_ms:.2f}x")
         print()
-        
-        # Find best and worst performance ratios
-        for p in performance_comparison:
-            p['ratio'] = p['swift_ms'] / p['python_ms'] if p['python_ms'] > 0 else float('inf')
-        
-        performance_comparison.sort(key=lambda x: x['ratio'])
-        
+
+        # O(N log 5) selection instead of sorting the whole list
+        best5 = heapq.nsmallest(5, performance_comparison, key=lambda p: p['ratio'])
+        worst5 = heapq.nlargest(5, performance_comparison, key=lambda p: p['ratio'])[::-1]
+
         print("Best Swift performance (relative to Python):")
-        for p in performance_comparison[:5]:
+        for p in best5:
             print(f"  '{p['input']}': {p['ratio']:.2f}x (Python: {p['python_ms']:.3f}ms, Swift: {p['swift_ms']:.3f}ms)")
         print()
-        
+
         print("Worst Swift performance (relative to Python):")
-        for p in performance_comparison[-5:]:
+        for p in worst5:
             print(f"  '{p['input']}': {p['ratio']:.2f}x (Python: {p['python_ms']:.3f}ms, Swift: {p['swift_ms']:.3f}ms)")
 
+# Features present in Python dateutil but missing in Swift; built once at
+# import as a constant tuple instead of a dict rebuilt on every call
+_MISSING_FEATURES = (
+    ("fuzzy_with_tokens", "Returns both parsed date and skipped tokens"),
+    ("ignoretz", "Option to ignore timezone information"),
+    ("tzinfos", "Custom timezone abbreviation mapping"),
+    ("parserinfo customization", "Ability to subclass parserinfo for different languages"),
+    ("stream parsing", "Parse from file-like objects"),
+    ("bytes/bytearray support", "Parse from bytes or bytearray"),
+    ("relative date parsing", "Limited - Swift handles basic cases but not complex ones"),
+    ("fuzzy parsing", "Limited - Swift's fuzzy mode is less sophisticated"),
+    ("ordinal support", "Partial - Swift handles some ordinals but not all formats"),
+    ("logger format with comma", "Swift doesn't parse milliseconds from comma separator"),
+    ("timezone parsing", "Swift ignores timezone offsets in parsed dates"),
+    ("two-digit year handling", "Different algorithm - Swift doesn't use 50-year window"),
+    ("default date components", "Swift uses fixed defaults, Python uses current date/time"),
+    ("validation", "Python validates dates (no Feb 30), Swift auto-corrects"),
+    ("AM/PM with dots", "Python handles 'a.m.' and 'p.m.', Swift may not"),
+    ("era markers", "Limited support for AD/BC in both, but different handling"),
+    ("numeric-only dates", "Different interpretation of pure numbers like '99' or '2003'"),
+    ("multiple date extraction", "NLPDateExtractor exists but works differently"),
+    ("week dates", "ISO week date format (YYYY-Www-D) not supported in Swift"),
+    ("decimal seconds", "Support for both . and , as decimal separators"),
+    ("24:00 time", "Converting 24:00 to next day 00:00"),
+    ("year 0 validation", "Python raises error for year 0, Swift may accept it")
+)
+
 def identify_missing_features():
     """Identify features present in Python dateutil but missing in Swift"""
     print("\n\nMissing Features Analysis")
     print("=" * 100)
     print()
-    
-    missing_features = {
-        "fuzzy_with_tokens": "Returns both parsed date and skipped tokens",
-        "ignoretz": "Option to ignore timezone information",
-        "tzinfos": "Custom timezone abbreviation mapping",
-        "parserinfo customization": "Ability to subclass parserinfo for different languages",
-        "stream parsing": "Parse from file-like objects",
-        "bytes/bytearray support": "Parse from bytes or bytearray",
-        "relative date parsing": "Limited - Swift handles basic cases but not complex ones",
-        "fuzzy parsing": "Limited - Swift's fuzzy mode is less sophisticated",
-        "ordinal support": "Partial - Swift handles some ordinals but not all formats",
-        "logger format with comma": "Swift doesn't parse milliseconds from comma separator",
-        "timezone parsing": "Swift ignores timezone offsets in parsed dates",
-        "two-digit year handling": "Different algorithm - Swift doesn't use 50-year window",
-        "default date components": "Swift uses fixed defaults, Python uses current date/time",
-        "validation": "Python validates dates (no Feb 30), Swift auto-corrects",
-        "AM/PM with dots": "Python handles 'a.m.' and 'p.m.', Swift may not",
-        "era markers": "Limited support for AD/BC in both, but different handling",
-        "numeric-only dates": "Different interpretation of pure numbers like '99' or '2003'",
-        "multiple date extraction": "NLPDateExtractor exists but works differently",
-        "week dates": "ISO week date format (YYYY-Www-D) not supported in Swift",
-        "decimal seconds": "Support for both . and , as decimal separators",
-        "24:00 time": "Converting 24:00 to next day 00:00",
-        "year 0 validation": "Python raises error for year 0, Swift may accept it"
-    }
-    
+
     print("Features in Python dateutil not fully implemented in Swift:")
-    for feature, description in missing_features.items():
+    for feature, description in _MISSING_FEATURES:
         print(f"• {feature}: {description}")
     
     print("\n\nRecommendations:")